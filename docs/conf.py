@@ -71,6 +71,8 @@ exclude_patterns = ['_build', '**.ipynb_checkpoints']
 # -----------------------------------------------------------------------------
 # Autosummary
 # -----------------------------------------------------------------------------
+# Since Sphinx 3.0, stub files are only rewritten when their content changes,
+# so regenerating them does not invalidate the cached doctrees.
 autosummary_generate = True
 
 # -----------------------------------------------------------------------------
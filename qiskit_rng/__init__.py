@@ -49,7 +49,36 @@ Functions
     generate_wsr
 """
 
-from .generator import Generator
-from .generator_job import GeneratorJob
-from .generator_result import GeneratorResult
-from .utils import generate_wsr
+import importlib
+import sys
+
+__all__ = ['Generator', 'GeneratorJob', 'GeneratorResult', 'generate_wsr']
+
+# Submodules are only imported when one of their names is first accessed,
+# so that importing the package does not load Qiskit unless it is needed.
+_LAZY_IMPORTS = {
+    'Generator': '.generator',
+    'GeneratorJob': '.generator_job',
+    'GeneratorResult': '.generator_result',
+    'generate_wsr': '.utils',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported before Python 3.7.
+    from .generator import Generator
+    from .generator_job import GeneratorJob
+    from .generator_result import GeneratorResult
+    from .utils import generate_wsr
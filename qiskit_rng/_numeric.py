@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Numerical kernels used by the utility functions.
+
+The kernels are compiled with Numba if it is installed, and run as regular
+Python functions otherwise.
+"""
+
+from typing import Callable
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # pylint: disable=unused-argument
+        """Return the decorated function unchanged if Numba is not installed."""
+        def _decorator(func):
+            return func
+        return _decorator
+
+MAX_KERNEL_INPUT = 2**31
+"""Upper bound for the inputs of the modular arithmetic kernels.
+
+The product of two residues needs to fit in a 64-bit integer when compiled.
+"""
+
+# Witnesses for which the Miller-Rabin test is deterministic for all
+# numbers below 3.1*10^23, which includes all 64-bit integers.
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def py_func(kernel: Callable) -> Callable:
+    """Return the Python version of a kernel.
+
+    The kernels do not call each other, so the Python version does not use
+    any compiled code.
+
+    Args:
+        kernel: A kernel in this module.
+
+    Returns:
+        The kernel before compilation, which works with arbitrarily large integers.
+    """
+    return getattr(kernel, 'py_func', kernel)
+
+
+@njit(cache=True)
+def _prime_check(num):
+    """Check whether the input number is a prime number using trial division."""
+    if num < 4:
+        return num > 1
+    if num % 2 == 0 or num % 3 == 0:
+        return False
+    # All primes above 3 are of the form 6k-1 or 6k+1. Compare against
+    # num // i since i * i overflows for inputs close to 2**63.
+    i = 5
+    while i <= num // i:
+        if num % i == 0 or num % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+
+@njit(cache=True)
+def _prime_check_mr(num):
+    """Check whether the input number is a prime using the Miller-Rabin test."""
+    if num < 2:
+        return False
+    for prime in _MR_WITNESSES:
+        if num % prime == 0:
+            return num == prime
+    # Write num-1 as odd_part * 2**num_twos with an odd odd_part.
+    odd_part = num - 1
+    num_twos = 0
+    while odd_part % 2 == 0:
+        odd_part //= 2
+        num_twos += 1
+    for witness in _MR_WITNESSES:
+        # Compute witness**odd_part % num using square-and-multiply.
+        x = 1
+        base = witness
+        exp = odd_part
+        while exp > 0:
+            if exp & 1:
+                x = x * base % num
+            base = base * base % num
+            exp >>= 1
+        if x in (1, num - 1):
+            continue
+        composite = True
+        for _ in range(num_twos - 1):
+            x = x * x % num
+            if x == num - 1:
+                composite = False
+                break
+        if composite:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _prime_factors(num):
+    """Return the distinct prime factors of the input number and their powers."""
+    factors = []
+    powers = []
+    divisor = 2
+    step = 2
+    while divisor <= num // divisor:
+        power = 0
+        while num % divisor == 0:
+            num //= divisor
+            power += 1
+        if power:
+            factors.append(divisor)
+            powers.append(power)
+        # Try 2, 3 and then the numbers of the form 6k-1 and 6k+1.
+        if divisor < 5:
+            divisor = 2 * divisor - 1
+        else:
+            divisor += step
+            step = 6 - step
+    if num != 1:
+        factors.append(num)
+        powers.append(1)
+    return factors, powers
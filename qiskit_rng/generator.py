@@ -24,13 +24,16 @@
 
 """Module for random number generator."""
 
+import json
 import logging
 import pickle
-import uuid
 import os
+import tempfile
+from functools import partial
 from itertools import product
 from typing import List, Tuple, Callable, Optional, Any, Union
 
+import numpy as np
 from qiskit import QuantumCircuit, transpile, assemble
 from qiskit.providers.basebackend import BaseBackend
 from qiskit.providers.basejob import BaseJob
@@ -76,6 +79,7 @@ class Generator:
     """
 
     _file_prefix = "qiskit_rng"
+    _file_magic = b"QRNG"
     _job_tag = 'qiskit_rng'
 
     def __init__(
@@ -83,31 +87,39 @@ class Generator:
             backend: BaseBackend,
             wsr_generator: Optional[Callable] = None,
             noise_model: Any = None,
-            save_local: bool = False
+            save_local: bool = False,
+            preserve_barriers: bool = True
     ) -> None:
         """Generator constructor.
 
         Args:
             backend: Backend to use for generating random numbers.
             wsr_generator: Function used to generate WSR. It must take the
-                number of bits as the input and a list of random bits (0s and 1s)
-                as the output. If ``None``, :func:`qiskit_rng.generate_wsr` is used.
+                number of bits as the input and a list or 1-D array of random bits
+                (0s and 1s) as the output. If ``None``, :func:`qiskit_rng.generate_wsr`
+                is used with ``secure=True``.
             noise_model: Noise model to use. Only applicable if `backend` is a
                 simulator.
             save_local: If ``True``, the generated WSR and other metadata is
-                saved into a pickle file in the local directory. The file can
+                saved into a file in the local directory. The file can
                 be used to recover and resume a sampling if needed.
                 The file name will be in the format of
                 ``qiskit_rng_<backend>_<num_raw_bits>_<id>``.
                 The file will be deleted automatically when the corresponding
                 :meth:`GeneratorJob.block_until_ready()` method is invoked.
                 Only supported if `backend` is an ``IBMQBackend``.
+            preserve_barriers: If ``False``, the barrier between the entangling
+                and the measurement basis gates is left out of the circuits, which
+                allows the transpiler to optimize across them.
         """
         self.backend = backend
         self.job_manager = IBMQJobManager()
-        self.wsr_generator = wsr_generator or generate_wsr
+        self.wsr_generator = wsr_generator or partial(generate_wsr, secure=True)
         self.noise_model = noise_model
         self.save_local = save_local
+        self.preserve_barriers = preserve_barriers
+        self._transpiled_cache = {}
+        self._backend_info = None
 
     def sample(
             self,
@@ -131,20 +143,23 @@ class Generator:
                 (HAS_V2_BACKEND and not isinstance(self.backend, Backend)):
             raise ValueError("Backend needs to be a Qiskit `BaseBackend` or `Backend` instance.")
 
-        max_shots = self.backend.configuration().max_shots
-        num_raw_bits_qubit = int((num_raw_bits + 2)/3)
+        _, max_shots = self._get_backend_info()
+        num_raw_bits_qubit = (num_raw_bits + 2) // 3
         if num_raw_bits_qubit <= max_shots:
             shots = num_raw_bits_qubit
             num_circuits = 1
         else:
-            num_circuits = int((num_raw_bits_qubit + max_shots - 1)/max_shots)
-            shots = int((num_raw_bits_qubit + num_circuits - 1)/num_circuits)
+            num_circuits = (num_raw_bits_qubit + max_shots - 1) // max_shots
+            shots = (num_raw_bits_qubit + num_circuits - 1) // num_circuits
 
         logger.debug("Using %s circuits with %s shots each", num_circuits, shots)
 
         initial_wsr = self.wsr_generator(num_circuits * 3)
-
         wsr_bits = self._get_wsr(num_circuits, initial_wsr)
+        # Circuits sharing the same WSR value are not merged into one experiment:
+        # more than one circuit is only used when the shots would exceed
+        # ``max_shots``, and all experiments in a job share the same shots.
+        # Only their transpilation is shared, see `_transpile_base_circuits`.
         circuits = self._generate_all_circuits(num_circuits, wsr_bits)
 
         job = self._run_circuits(circuits, shots)
@@ -173,13 +188,25 @@ class Generator:
         Returns:
             An IBMQ managed job set or a job.
         """
-        transpiled = transpile(circuits, backend=self.backend, optimization_level=2)
-        transpiled = [transpiled] if not isinstance(transpiled, list) else transpiled
+        # Circuits are normally references to the base circuits, so reuse their
+        # transpiled versions instead of transpiling every copy.
+        base_transpiled = dict(zip(map(id, self._get_base_circuits()),
+                                   self._transpile_base_circuits()))
+        if all(id(circ) in base_transpiled for circ in circuits):
+            transpiled = [base_transpiled[id(circ)] for circ in circuits]
+        else:
+            transpiled = transpile(list(circuits), backend=self.backend, optimization_level=2)
 
-        if isinstance(self.backend, IBMQBackend):
+        if isinstance(self.backend, IBMQBackend) and len(transpiled) > 1:
             job = self.job_manager.run(transpiled, backend=self.backend, shots=shots,
                                        job_tags=[self._job_tag], memory=True)
             logger.info("Jobs submitted to %s. Job set ID is %s.", self.backend, job.job_set_id())
+        elif isinstance(self.backend, IBMQBackend):
+            # A single circuit always fits in one job, so skip the job manager.
+            job = self.backend.run(assemble(transpiled, backend=self.backend, shots=shots,
+                                            memory=True),
+                                   job_tags=[self._job_tag])
+            logger.info("Job submitted to %s. Job ID is %s.", self.backend, job.job_id())
         else:
             job = self.backend.run(assemble(transpiled, backend=self.backend, shots=shots,
                                             memory=True, noise_model=self.noise_model))
@@ -187,7 +214,11 @@ class Generator:
 
         return job
 
-    def _get_wsr(self, num_circuits: int, initial_wsr: List[int]) -> List:
+    def _get_wsr(
+            self,
+            num_circuits: int,
+            initial_wsr: Union[List[int], np.ndarray]
+    ) -> np.ndarray:
         """Obtain the weak source of randomness bits used to generate circuits.
 
         Args:
@@ -195,19 +226,15 @@ class Generator:
             initial_wsr: Raw WSR bits used to generate the output WSR.
 
         Returns:
-            A list the size of `num_circuits`. Each element in the
-                list is another list of 3 binary numbers.
+            A 2-D ``uint8`` array with `num_circuits` rows. Each row
+                contains 3 binary numbers.
                 For example,
                 [ [1, 0, 0], [0, 1, 1], [1, 1, 0], ...]
         """
-        output_wsr = []
-        for i in range(num_circuits):
-            output_wsr.append(
-                [int(initial_wsr[3*i]), int(initial_wsr[3*i+1]), int(initial_wsr[3*i+2])])
+        return np.asarray(initial_wsr[:num_circuits*3], dtype=np.uint8).reshape(num_circuits, 3)
 
-        return output_wsr
-
-    def _generate_circuit(self, label: Tuple[int, int, int]) -> QuantumCircuit:
+    @staticmethod
+    def _generate_circuit(label: Tuple[int, int, int], barrier: bool = True) -> QuantumCircuit:
         """Generate a circuit based on the input label.
 
         The size of the input label determines the number of qubits.
@@ -217,6 +244,7 @@ class Generator:
         Args:
             label: Label used to determine how the circuit is to be constructed.
                 A tuple of 1s and 0s.
+            barrier: Whether to add a barrier before the measurement basis gates.
 
         Returns:
             Constructed circuit.
@@ -227,7 +255,8 @@ class Generator:
         for i in range(1, num_qubit):
             qc.cx(0, i)
         qc.s(0)
-        qc.barrier()
+        if barrier:
+            qc.barrier()
         for i in range(num_qubit):
             if label[i] == 1:
                 qc.sdg(i)
@@ -236,7 +265,64 @@ class Generator:
         qc.measure(qc.qregs[0], qc.cregs[0])
         return qc
 
-    def _generate_all_circuits(self, num_circuits: int, wsr_bits: List) -> List[QuantumCircuit]:
+    def _get_backend_info(self) -> Tuple[str, int]:
+        """Return the name and the maximum number of shots of the backend.
+
+        The values are only looked up once for each backend. If :attr:`backend`
+        is replaced, they are looked up again and the transpiled circuits
+        are discarded.
+
+        Returns:
+            A tuple of the backend name and its maximum number of shots.
+        """
+        if self._backend_info is None or self._backend_info[0] is not self.backend:
+            self._backend_info = (self.backend, self.backend.name(),
+                                  self.backend.configuration().max_shots)
+            self._transpiled_cache = {}
+        return self._backend_info[1:]
+
+    def _get_backend_name(self) -> str:
+        """Return the name of the backend.
+
+        Returns:
+            Name of the backend.
+        """
+        return self._get_backend_info()[0]
+
+    def _get_base_circuits(self) -> List[QuantumCircuit]:
+        """Return the base circuits for each of the 8 possible WSR values.
+
+        Returns:
+            A list of 8 circuits. The circuit at index ``i`` corresponds to
+            the 3-bit WSR value ``i``.
+        """
+        return _BASE_CIRCUITS[self.preserve_barriers]
+
+    def _transpile_base_circuits(self) -> List[QuantumCircuit]:
+        """Return the base circuits transpiled for the backend.
+
+        The transpiled circuits are cached, so they are only transpiled once
+        for each backend and barrier setting.
+
+        Returns:
+            A list of 8 transpiled circuits, in the same order as
+            :meth:`_get_base_circuits`.
+        """
+        # Looking up the backend info clears the cache if the backend changed.
+        self._get_backend_info()
+        cache_key = self.preserve_barriers
+        if cache_key not in self._transpiled_cache:
+            # Transpile all base circuits in a single call, which lets the
+            # transpiler distribute them over its process pool.
+            self._transpiled_cache[cache_key] = transpile(
+                self._get_base_circuits(), backend=self.backend, optimization_level=2)
+        return self._transpiled_cache[cache_key]
+
+    def _generate_all_circuits(
+            self,
+            num_circuits: int,
+            wsr_bits: np.ndarray
+    ) -> List[QuantumCircuit]:
         """Generate all circuits based on input WSR bits.
 
         Args:
@@ -246,27 +332,18 @@ class Generator:
         Returns:
             A list of generated circuits.
         """
-        # Generate 3-qubit circuits for each of the 8 permutations.
-        num_qubits = 3
-        labels = list(product([0, 1], repeat=num_qubits))
-
-        # Generate base circuits.
-        circuits = []
-        for label in labels:
-            circuits.append(self._generate_circuit(label))
-
         # Construct final circuits using input WSR bits.
-        final_circuits = []
-        for i in range(num_circuits):
-            wsr_set = wsr_bits[i]    # Get the 3-bit value.
-            final_circuits.append(circuits[labels.index(tuple(wsr_set))])
+        wsr_bits = wsr_bits[:num_circuits]
+        codes = (wsr_bits[:, 0] << 2) | (wsr_bits[:, 1] << 1) | wsr_bits[:, 2]
+        circuits = self._get_base_circuits()
+        final_circuits = [circuits[code] for code in codes.tolist()]
 
         return final_circuits
 
     def _save_local(
             self,
             num_raw_bits: int,
-            wsr_bits: List,
+            wsr_bits: np.ndarray,
             job: Union[ManagedJobSet, BaseJob],
             shots: int
     ) -> str:
@@ -282,20 +359,26 @@ class Generator:
             Name of the file with saved data.
         """
         file_prefix = "{}_{}_{}_".format(
-            self._file_prefix, self.backend.name(), num_raw_bits)
-        file_name = file_prefix + str(uuid.uuid4())[:4]
-        while os.path.exists(file_name):
-            file_name = file_prefix + str(uuid.uuid4())[:4]
+            self._file_prefix, self._get_backend_name(), num_raw_bits)
 
-        data = {"wsr": wsr_bits, "shots": shots}
+        data = {"shots": shots, "backend": self._get_backend_name()}
         if isinstance(job, ManagedJobSet):
             data["job_id"] = job.job_set_id()
             data["job_type"] = "jobset"
         else:
             data["job_id"] = job.job_id()
             data["job_type"] = "job"
-        with open(file_name, 'wb') as file:
-            pickle.dump(data, file)
+        header = json.dumps(data).encode('utf-8')
+
+        # The file contains a magic string, the length of the JSON header,
+        # the header itself, and the WSR bits in ``.npy`` format.
+        # mkstemp atomically creates a file with a unique name.
+        file_desc, file_name = tempfile.mkstemp(prefix=file_prefix, dir=os.curdir)
+        with os.fdopen(file_desc, 'wb') as file:
+            file.write(self._file_magic)
+            file.write(len(header).to_bytes(4, 'little'))
+            file.write(header)
+            np.save(file, np.asarray(wsr_bits, dtype=np.uint8))
         return file_name
 
     @classmethod
@@ -310,7 +393,14 @@ class Generator:
             Recovered output of the original :meth:`sample` call.
         """
         with open(file_name, 'rb') as file:
-            data = pickle.load(file)
+            if file.read(len(cls._file_magic)) == cls._file_magic:
+                header_len = int.from_bytes(file.read(4), 'little')
+                data = json.loads(file.read(header_len).decode('utf-8'))
+                data['wsr'] = np.load(file)
+            else:
+                # Files saved by earlier versions are pickled.
+                file.seek(0)
+                data = pickle.load(file)
         job_id = data['job_id']
         job_type = data['job_type']
         if job_type == "jobset":
@@ -325,3 +415,12 @@ class Generator:
             shots=data["shots"],
             saved_fn=file_name
         )
+
+
+# Base circuits for each of the 8 permutations of a 3-bit WSR value, with and
+# without barriers. The labels are produced in binary order, so the index of
+# a label in each list is the integer value of its 3 bits.
+_BASE_CIRCUITS = {
+    barrier: [Generator._generate_circuit(label, barrier) for label in product([0, 1], repeat=3)]
+    for barrier in (True, False)
+}
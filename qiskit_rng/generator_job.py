@@ -28,6 +28,7 @@ import os
 import logging
 from typing import List, Union, Optional
 
+import numpy as np
 from qiskit.providers.basejob import BaseJob
 from qiskit.providers.ibmq.managed.ibmqjobmanager import ManagedJobSet
 from qiskit.result.result import Result
@@ -42,8 +43,8 @@ class GeneratorJob:
 
     def __init__(
             self,
-            initial_wsr: List[int],
-            wsr: List[List],
+            initial_wsr: Union[List[int], np.ndarray],
+            wsr: np.ndarray,
             job: Union[BaseJob, ManagedJobSet],
             shots: int,
             saved_fn: Optional[str] = None
@@ -64,8 +65,27 @@ class GeneratorJob:
         self.shots = shots
 
         self.raw_bits_list = None
-        self.formatted_wsr = None
         self.saved_fn = saved_fn
+        self._formatted_wsr = None
+
+    @property
+    def formatted_wsr(self) -> np.ndarray:
+        """Return the formatted WSR.
+
+        The WSR is converted to the format of
+        ``[wsr1, wsr1, ... wsr1_n, wsr2, wsr2, ...]``
+        where ``n`` is the number of shots. Each wsr is a row of 3 bits
+        in a 2-D ``uint8`` array. The conversion is only done on first access.
+
+        Returns:
+            The formatted WSR.
+        """
+        if self._formatted_wsr is None:
+            # Convert [wsr1, wsr2] to [wsr1, wsr1, ...wsr1_n, wsr2, wsr2, ...],
+            # where n is the number of shots. Each wsr is a row of 3 bits.
+            self._formatted_wsr = np.repeat(
+                np.asarray(self.wsr, dtype=np.uint8), self.shots, axis=0)
+        return self._formatted_wsr
 
     def block_until_ready(self) -> GeneratorResult:
         """Block until result data is ready.
@@ -83,29 +103,15 @@ class GeneratorJob:
         logger.info("All jobs finished, transforming job results.")
 
         self.raw_bits_list = self._ibmq_result_transform(job_result)
-        self._format_wsr()
         if self.saved_fn:
             try:
                 os.remove(self.saved_fn)
             except Exception:   # pylint: disable=broad-except
                 logger.warning("Unable to delete file %s", self.saved_fn)
-        return GeneratorResult(wsr=self.formatted_wsr, raw_bits_list=self.raw_bits_list,
-                               backend=self.backend)
-
-    def _format_wsr(self):
-        """Format the wsr.
-
-        Convert the WSR to the format of
-        ``[wsr1, wsr1, ... wsr1_n, wsr2, wsr2, ...]``
-        where ``n`` is the number of shots. Each wsr is a list of 3 bits.
-        """
-        if not self.formatted_wsr:
-            # Convert [wsr1, wsr2] to [wsr1, wsr1, ...wsr1_n, wsr2, wsr2, ...],
-            # where n is the number of shots. Each wsr is a list of 3 bits.
-            self.formatted_wsr = \
-                [wsr_set[:] for wsr_set in self.wsr for _ in range(self.shots)]
+        return GeneratorResult(wsr=self.wsr, raw_bits_list=self.raw_bits_list,
+                               backend=self.backend, shots=self.shots)
 
-    def _ibmq_result_transform(self, result: Result) -> List[List]:
+    def _ibmq_result_transform(self, result: Result) -> np.ndarray:
         """Transform IBMQ result data into the proper format.
 
         Args:
@@ -113,16 +119,40 @@ class GeneratorJob:
 
         Returns:
             Job results in the format of
-            ``[circ1_shot1, circ1_shot2, ..., circ2_shot1, circ2_shot2, ...]``.
-            Each circn_shotn is a list of 3 bits.
+            ``[circ1_shot1, circ1_shot2, ..., circ2_shot1, circ2_shot2, ...]``,
+            as a 2-D ``uint8`` array. Each circn_shotn is a row of 3 bits.
         """
-        all_results = []
-        for i in range(len(result.results)):
-            # Convert ['101', '110', ...] to [[1, 0, 1], [0, 1, 1], ...]
-            circ_mem = result.get_memory(i)  # ['101', '110', ...]
-            for shot_mem in circ_mem:
-                shot_list = [int(mem) for mem in shot_mem]
-                shot_list.reverse()
-                all_results.append(shot_list)
-
-        return all_results
+        all_values = []
+        for i, exp_result in enumerate(result.results):
+            # Read the memory directly instead of using ``result.get_memory()``,
+            # which formats each shot as a bit string.
+            circ_mem = getattr(exp_result.data, 'memory', None)  # ['0x5', '0x6', ...]
+            if circ_mem is None:
+                circ_mem = result.get_memory(i)  # ['101', '110', ...]
+                all_values.append(np.array([int(mem, 2) for mem in circ_mem]))
+            else:
+                all_values.append(_hex_memory_to_int(circ_mem))
+
+        # Convert [5, 6, ...] to [[1, 0, 1], [0, 1, 1], ...], where the
+        # first bit of each row is the first classical bit.
+        num_bits = result.results[0].header.memory_slots
+        values = np.concatenate(all_values)
+        return ((values[:, None] >> np.arange(num_bits)) & 1).astype(np.uint8)
+
+
+def _hex_memory_to_int(memory: List[str]) -> np.ndarray:
+    """Convert hexadecimal shot memory to integers.
+
+    Args:
+        memory: Memory of each shot, in the format of ``['0x5', '0x6', ...]``.
+
+    Returns:
+        The integer value of each shot.
+    """
+    joined = ''.join(memory).lower()
+    if len(joined) == 3 * len(memory):
+        # Every shot is a single digit ``0x0`` - ``0xf``, which is always the
+        # case for up to 4 classical bits, so decode the digits in one pass.
+        digits = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)[2::3].astype(np.int64)
+        return np.where(digits > ord('9'), digits - (ord('a') - 10), digits - ord('0'))
+    return np.array([int(mem, 16) for mem in memory])
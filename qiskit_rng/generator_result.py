@@ -24,14 +24,16 @@
 
 """Generator job result."""
 
-from typing import List, Optional, Callable, Tuple
+from functools import partial
+from typing import List, Optional, Callable, Tuple, Union
 from math import floor
 
+import numpy as np
 from qiskit.providers.basebackend import BaseBackend
 from qiskit.providers.ibmq.exceptions import IBMQError
 
-from .utils import (bell_value, generate_wsr, get_extractor_bits, bitarray_to_bytes,
-                    h_mins, na_set, dodis_output_size, hayashi_parameters)
+from .utils import (bell_value, generate_wsr, generate_wsr_bytes, raw_bits_to_bytes,
+                    bitarray_to_bytes, h_mins, na_set, dodis_output_size, hayashi_parameters)
 from .model import CQCExtractorParams
 from .exceptions import RNGNotAuthorizedError
 
@@ -41,9 +43,10 @@ class GeneratorResult:
 
     def __init__(
             self,
-            wsr: List[List[int]],
-            raw_bits_list: List[List[int]],
-            backend: BaseBackend
+            wsr: Union[List[List[int]], np.ndarray],
+            raw_bits_list: Union[List[List[int]], np.ndarray],
+            backend: BaseBackend,
+            shots: int = 1
     ) -> None:
         """GeneratorResult constructor.
 
@@ -59,17 +62,63 @@ class GeneratorResult:
             * losing_probability: 1-`winning_probability`.
 
         Args:
-            wsr: WSR used to generate the circuits.
-            raw_bits_list: A list of formatted bits from job results.
+            wsr: WSR used to generate the circuits. Each WSR applies to `shots`
+                consecutive rows of `raw_bits_list`.
+            raw_bits_list: Formatted bits from job results, one row of 3 bits
+                per shot.
             backend: Backend used to generate the bits.
+            shots: Number of shots each WSR was used for.
         """
-        self.wsr = wsr
-        self._raw_bits_list = raw_bits_list
-        self.raw_bits = [bit for sublist in raw_bits_list for bit in sublist]
+        self._wsr = np.asarray(wsr, dtype=np.uint8)
+        self._shots = shots
+        self._formatted_wsr = None
+        self._raw_bits_list = np.asarray(raw_bits_list, dtype=np.uint8)
+        self.raw_bits = self._raw_bits_list.ravel().tolist()
         self.backend = backend
 
         self.losing_probability, self.winning_probability, self.mermin_correlator = \
-            bell_value(wsr, raw_bits_list)
+            bell_value(self._wsr, self._raw_bits_list, shots)
+
+    @property
+    def wsr(self) -> np.ndarray:
+        """Return the WSR for each shot.
+
+        Returns:
+            A 2-D ``uint8`` array with the row of 3 WSR bits used for each
+            shot, aligned with :attr:`raw_bits_list`. The array is only
+            built on first access.
+        """
+        if self._formatted_wsr is None:
+            self._formatted_wsr = np.repeat(self._wsr, self._shots, axis=0)
+        return self._formatted_wsr
+
+    @property
+    def raw_bits_list(self) -> np.ndarray:
+        """Return the formatted bits from job results.
+
+        Returns:
+            A 2-D ``uint8`` array with a row of 3 bits for each shot.
+        """
+        return self._raw_bits_list
+
+    @property
+    def raw_bits_packed(self) -> np.ndarray:
+        """Return the formatted bits from job results, packed into bytes.
+
+        Returns:
+            A 2-D ``uint8`` array with one byte for each shot. The bits of
+            the shot are stored in the most significant bits of the byte.
+        """
+        return np.packbits(self._raw_bits_list, axis=1)
+
+    @property
+    def raw_bits_as_list(self) -> List[List[int]]:
+        """Return the formatted bits from job results as Python lists.
+
+        Returns:
+            A list with a list of 3 bits for each shot.
+        """
+        return self._raw_bits_list.tolist()
 
     def bell_values(self) -> Tuple[float, float, float]:
         """Return a tuple of the bell values.
@@ -116,8 +165,9 @@ class GeneratorResult:
                 backend and communicated securely.
             privacy: ``True`` if privacy amplification is to be performed.
             wsr_generator: Function used to generate WSR. It must take the
-                number of bits as the input and a list of random bits (0s and 1s)
-                as the output.
+                number of bits as the input and a list or 1-D array of random bits
+                (0s and 1s) as the output. If ``None``, :func:`qiskit_rng.generate_wsr`
+                is used with ``secure=True``.
 
         Returns:
             A ``CQCExtractorParams`` instance that contains all the parameters
@@ -136,14 +186,15 @@ class GeneratorResult:
         if privacy and not trusted_backend:
             raise ValueError("Cannot perform privacy amplification using a untrusted backend.")
 
-        if wsr_generator is None:
-            wsr_generator = generate_wsr
+        default_wsr = wsr_generator is None
+        if default_wsr:
+            wsr_generator = partial(generate_wsr, secure=True)
 
         correlator = expected_correlator
         losing_prob = (4-correlator)/16
 
-        bits = get_extractor_bits(self._raw_bits_list)
-        num_bits = len(bits)
+        # The extractor takes the first 2 bits of each shot.
+        num_bits = 2 * len(self._raw_bits_list)
         rate_bt = h_mins(losing_prob, num_bits, rate_sv)
 
         # EXT1 (Dodis):
@@ -153,7 +204,6 @@ class GeneratorResult:
         # Adjust rate_bt in case bits need to be dropped due to
         # Dodis input size restriction.
         rate_bt = (num_bits*rate_bt-diff)/(num_bits-diff)
-        bits = bits[:n_dodis]
         if na_set(n_dodis-1)+1 != n_dodis:
             raise ValueError("Wrong computation in the first extractor input size.")
         dodis_output_len = dodis_output_size(
@@ -162,8 +212,11 @@ class GeneratorResult:
             raise ValueError('Not enough output for the first extractor. Try '
                              'reducing security parameters or increasing sample size.')
 
-        raw_bytes = bitarray_to_bytes(bits)
-        wsr_bytes = bitarray_to_bytes(wsr_generator(n_dodis))
+        raw_bytes = raw_bits_to_bytes(self._raw_bits_list, n_dodis)
+        if default_wsr:
+            wsr_bytes = generate_wsr_bytes(n_dodis, secure=True)
+        else:
+            wsr_bytes = bitarray_to_bytes(wsr_generator(n_dodis))
 
         # EXT2 (Hayashi):
         ext2_params = [0, 0]
@@ -232,8 +285,9 @@ class GeneratorResult:
                 backend and communicated securely.
             privacy: ``True`` if privacy amplification is to be performed.
             wsr_generator: Function used to generate WSR. It must take the
-                number of bits as the input and a list of random bits (0s and 1s)
-                as the output.
+                number of bits as the input and a list or 1-D array of random bits
+                (0s and 1s) as the output. If ``None``, :func:`qiskit_rng.generate_wsr`
+                is used with ``secure=True``.
 
         Returns:
             The extracted random bits.
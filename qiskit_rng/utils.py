@@ -25,36 +25,45 @@
 """Module for utility functions."""
 
 import logging
-from typing import List, Tuple
+import os
+import warnings
+from functools import lru_cache
+from typing import List, Tuple, Optional
 from math import sqrt, log2, floor
 
 import numpy as np
 
+from ._numeric import MAX_KERNEL_INPUT, py_func, _prime_check, _prime_check_mr, _prime_factors
+
 logger = logging.getLogger(__name__)
 
+_RNG = np.random.default_rng()
+
+_SQRT3 = sqrt(3)
+_LOG2_SQRT3_OVER_2 = log2(_SQRT3 / 2)
+
 
 def bell_value(
         wsr: List[List[int]],
-        raw_bits: List[List[int]]
+        raw_bits: List[List[int]],
+        shots: int = 1
 ) -> Tuple[float, float, float]:
     """Calculate the bell values.
 
     Args:
         wsr: WSR used to calculate the raw bits.
         raw_bits: Random bits used to calculate the bell values.
+        shots: Number of consecutive entries in `raw_bits` each WSR was used for.
 
     Returns:
         A tuple of Mermin losing probability, winning probability, and correlator.
     """
-    losing_prob = 0
-    for i in range(len(wsr)):   # pylint: disable=consider-using-enumerate
-        wsr_sum = sum(wsr[i])
-        raw_bits_sum = sum(raw_bits[i])
-        if wsr_sum == 1 and raw_bits_sum % 2 == 1:
-            losing_prob += 1
-        elif wsr_sum == 3 and raw_bits_sum % 2 == 0:
-            losing_prob += 1
-    losing_prob = losing_prob / len(wsr)
+    wsr_sum = np.asarray(wsr, dtype=np.uint8).sum(axis=1)[:, None]
+    # One row per WSR, with the parity of the raw bits of each of its shots.
+    raw_bits_parity = np.bitwise_xor.reduce(
+        np.asarray(raw_bits, dtype=np.uint8), axis=1).reshape(len(wsr_sum), shots)
+    losing = ((wsr_sum == 1) & (raw_bits_parity == 1)) | ((wsr_sum == 3) & (raw_bits_parity == 0))
+    losing_prob = float(losing.mean())
     winning_prob = 1 - losing_prob
     correlator = 4-16*losing_prob
 
@@ -70,10 +79,10 @@ def get_extractor_bits(raw_bits: List[List[int]]) -> List[int]:
     Returns:
         A list of bits that can be used by the extractor.
     """
-    bits = []
-    for bit_set in raw_bits:
-        bits += bit_set[:2]
-    return bits
+    if len(raw_bits) == 0:
+        return []
+    # Take the first 2 bits of each shot.
+    return np.asarray(raw_bits, dtype=np.uint8)[:, :2].ravel().tolist()
 
 
 def h_mins(bt_value: float, num_bits: int, rate_sv: float) -> float:
@@ -105,21 +114,25 @@ def na_set(num_bits: int) -> int:
 
     Returns:
         Updated number in the set.
+
+    Raises:
+        ValueError: If the input number is less than 2.
     """
+    if num_bits < 2:
+        raise ValueError("Number of bits needs to be at least 2.")
     if num_bits % 2 != 0:
         num_bits = num_bits - 1
     stop = False
     while not stop:
         stop = True
-        while not prime_check(num_bits + 1):
+        while not _is_prime_mr(num_bits + 1):
             num_bits = num_bits - 2
-        output = prime_factors(num_bits, True)
-        prime_powers = output[1]
-        primes = output[0]
-        for i in range(len(prime_powers)):
-            test = pow(2, int(num_bits / primes[i]), num_bits + 1)
+        primes, _ = _prime_factors_cached(num_bits)
+        for prime in primes:
+            test = pow(2, num_bits // prime, num_bits + 1)
             if test == 1:
                 stop = False
+                break
         if not stop:
             num_bits = num_bits - 2
     return num_bits
@@ -134,10 +147,25 @@ def prime_check(num: int) -> bool:
     Returns:
         Whether the number is a prime.
     """
-    for i in range(2, round(sqrt(num)) + 1):
-        if num % i == 0:
-            return False
-    return True
+    if num >= 2**63:
+        # Too large for the compiled kernel.
+        return py_func(_prime_check)(num)
+    return bool(_prime_check(num))
+
+
+def _is_prime_mr(num: int) -> bool:
+    """Check whether the input number is a prime using the Miller-Rabin test.
+
+    Args:
+        num: Number to be checked.
+
+    Returns:
+        Whether the number is a prime.
+    """
+    if num >= MAX_KERNEL_INPUT:
+        # Too large for the compiled kernel.
+        return py_func(_prime_check_mr)(num)
+    return bool(_prime_check_mr(num))
 
 
 def prime_factors(num: int, use_power: bool) -> List:
@@ -151,31 +179,35 @@ def prime_factors(num: int, use_power: bool) -> List:
 
     Returns:
         Prime factors.
+
+    Raises:
+        ValueError: If the input number is not positive.
     """
-    factors = []
-    i = 2
-    while i <= round(sqrt(num))+1:
-        if num % i == 0:
-            factors = np.append(factors, i)
-            num = num / i
-        else:
-            i = i + 1
-    if num != 1:
-        factors = np.append(factors, num)
-    factors_size = factors.size
-    factors2 = [factors[0]]
-    powers = [1]
-    power_idx = 0
-    for i in range(1, factors_size):
-        if factors[i] == factors[i-1]:
-            powers[power_idx] = powers[power_idx]+1
-        if factors[i] != factors[i-1]:
-            powers.append(1)
-            power_idx = power_idx+1
-            factors2.append(factors[i])
+    if num < 1:
+        raise ValueError("Number to factorize needs to be positive.")
+    if num >= 2**63:
+        # Too large for the compiled kernel.
+        factors, powers = py_func(_prime_factors)(num)
+    else:
+        factors, powers = _prime_factors(num)
+
     if not use_power:
-        return factors
-    return [factors2, powers]
+        return [factor for factor, power in zip(factors, powers) for _ in range(power)]
+    return [list(factors), list(powers)]
+
+
+@lru_cache(maxsize=1024)
+def _prime_factors_cached(num: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Return the prime factors and their powers, caching the result.
+
+    Args:
+        num: The number whose prime factors are to be returned.
+
+    Returns:
+        A tuple of the prime factors and a tuple of their powers.
+    """
+    factors, powers = prime_factors(num, True)
+    return tuple(factors), tuple(powers)
 
 
 def dodis_output_size(
@@ -199,10 +231,11 @@ def dodis_output_size(
     Returns:
         Output size of the Dodis extractor.
     """
+    log2_epsilon = log2(1 / epsilon_dodis)
     if not q_proof:
-        return floor(num_bits * (rate_bt + rate_sv - 1) + 1 - 2 * log2(1 / epsilon_dodis))
+        return floor(num_bits * (rate_bt + rate_sv - 1) + 1 - 2 * log2_epsilon)
     return floor(1 / 5 * (num_bits * (rate_bt + rate_sv - 1) + 1 - 8 *
-                          log2(1 / epsilon_dodis) - 8 * log2(sqrt(3) / 2)))
+                          log2_epsilon - 8 * _LOG2_SQRT3_OVER_2))
 
 
 def bt_adjusting(bt_value: float, epsilon: float, delta_finite_stat: int = 0) -> float:
@@ -232,14 +265,11 @@ def guessing_probability(bt_adjusted: float) -> float:
     Returns:
         The guessing probability.
     """
-    if bt_adjusted >= 1 / 16:
-        probability = 0.5 + 4 * bt_adjusted
-    if bt_adjusted < 1 / 16:
-        probability = 0.25 + 2 * bt_adjusted + \
-             sqrt(3) * sqrt((bt_adjusted - 4 * (bt_adjusted**2)))
     if bt_adjusted >= 1 / 8:
-        probability = 1
-    return probability
+        return 1.0
+    if bt_adjusted >= 1 / 16:
+        return 0.5 + 4 * bt_adjusted
+    return 0.25 + 2 * bt_adjusted + _SQRT3 * sqrt(bt_adjusted * (1 - 4 * bt_adjusted))
 
 
 def hayashi_parameters(
@@ -280,15 +310,30 @@ def bitarray_to_bytes(bitarray: List[int]) -> bytes:
     Returns:
         Input array in bytes.
     """
-    n_bits = len(bitarray)
-    n_bytes = (n_bits + 7) >> 3
-    int_array = [0] * n_bytes
-    for i in range(n_bits):
-        int_array[i >> 3] |= bitarray[i] << (i & 7)
-    return bytes(int_array)
+    # Bit ``i`` is stored in byte ``i >> 3`` at position ``i & 7``.
+    return np.packbits(np.asarray(bitarray, dtype=np.uint8), bitorder='little').tobytes()
+
+
+def raw_bits_to_bytes(raw_bits: List[List[int]], num_bits: Optional[int] = None) -> bytes:
+    """Convert raw bits from sampling jobs into extractor input bytes.
+
+    This is equivalent to ``bitarray_to_bytes(get_extractor_bits(raw_bits)[:num_bits])``
+    without creating the intermediate list of bits.
+
+    Args:
+        raw_bits: Input raw bits from sampling jobs.
+        num_bits: Number of extractor bits to use. If ``None``, all bits are used.
+
+    Returns:
+        The extractor bits in bytes.
+    """
+    if len(raw_bits) == 0:
+        return b''
+    bits = np.asarray(raw_bits, dtype=np.uint8)[:, :2].ravel()[:num_bits]
+    return np.packbits(bits, bitorder='little').tobytes()
 
 
-def bytes_to_bitarray(the_bytes: bytes, num_bits: int) -> List[int]:
+def bytes_to_bitarray(the_bytes: bytes, num_bits: int) -> np.ndarray:
     """Convert input bytes into an array of bits.
 
     Args:
@@ -296,18 +341,58 @@ def bytes_to_bitarray(the_bytes: bytes, num_bits: int) -> List[int]:
         num_bits: Number of bits to return.
 
     Returns:
-        An array of bits.
+        A 1-D ``uint8`` array of bits.
     """
-    return [(the_bytes[i >> 3] >> (i & 7)) & 1 for i in range(num_bits)]
+    bits = np.unpackbits(np.frombuffer(the_bytes, dtype=np.uint8), bitorder='little')
+    return bits[:num_bits]
+
+
+def generate_wsr(num_bits: int, secure: Optional[bool] = None) -> np.ndarray:
+    """Generate an array of WSR bits.
+
+    Args:
+        num_bits: Number of bits needed.
+        secure: If ``True``, the bits are read from the cryptographically
+            secure random number generator of the operating system. If ``False``,
+            the NumPy pseudo-random number generator is used. If ``None``,
+            the NumPy generator is used and a ``DeprecationWarning`` is issued.
+
+    Returns:
+        A 1-D ``uint8`` array of random binary numbers.
+    """
+    if secure is None:
+        _warn_insecure_wsr()
+        secure = False
+    return bytes_to_bitarray(generate_wsr_bytes(num_bits, secure), num_bits)
+
 
+def generate_wsr_bytes(num_bits: int, secure: Optional[bool] = None) -> bytes:
+    """Generate WSR bits packed into bytes.
 
-def generate_wsr(num_bits: int) -> List[int]:
-    """Generate a list of WSR bits.
+    The bits are packed the same way as :func:`bitarray_to_bytes`, and any
+    unused bits in the last byte are 0.
 
     Args:
         num_bits: Number of bits needed.
+        secure: Which random number generator to use. See :func:`generate_wsr`.
 
     Returns:
-        A list of random binary numbers.
+        The random bits in bytes.
     """
-    return list(np.random.randint(2, size=num_bits))
+    if secure is None:
+        _warn_insecure_wsr()
+        secure = False
+    num_bytes = (num_bits + 7) >> 3
+    raw = bytearray(os.urandom(num_bytes) if secure else _RNG.bytes(num_bytes))
+    if num_bits & 7:
+        raw[-1] &= (1 << (num_bits & 7)) - 1
+    return bytes(raw)
+
+
+def _warn_insecure_wsr() -> None:
+    """Warn that the WSR is generated with the pseudo-random number generator by default."""
+    warnings.warn("Generating the WSR without specifying `secure` is deprecated. Use "
+                  "secure=True to use the cryptographically secure random number "
+                  "generator of the operating system, or secure=False to keep using "
+                  "the NumPy pseudo-random number generator.",
+                  DeprecationWarning, stacklevel=3)
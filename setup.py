@@ -17,6 +17,7 @@ import os
 from setuptools import setup, find_packages
 
 REQUIREMENTS = [
+    "numpy>=1.17",
     "qiskit-ibmq-provider>=0.10",
     "qiskit-terra>=0.16.2"
 ]
@@ -61,6 +62,9 @@ setup(
     keywords="qiskit quantum cqc qrng",
     packages=find_packages(exclude=['test*']),
     install_requires=REQUIREMENTS,
+    extras_require={
+        "numba": ["numba>=0.50"],
+    },
     include_package_data=True,
     python_requires=">=3.6",
     project_urls={
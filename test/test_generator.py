@@ -15,9 +15,13 @@
 """Test for the generator."""
 
 from unittest import TestCase, mock
+from itertools import product
 import os
+import pickle
 
-from qiskit.test.mock.backends import FakeValencia
+import numpy as np
+from qiskit import transpile
+from qiskit.test.mock.backends import FakeValencia, FakeVigo
 from qiskit_rng import Generator, GeneratorJob, GeneratorResult
 
 
@@ -65,9 +69,22 @@ class TestGenerator(TestCase):
         except AssertionError:
             os.remove(saved_fn)
             raise
-        self.assertEqual(r_job.wsr, job.wsr)
+        self.assertEqual(r_job.wsr.tolist(), job.wsr.tolist())
         self.assertEqual(r_job.shots, job.shots)
 
+    def test_recover_pickled(self):
+        """Test recovering data saved in the pickle format."""
+        wsr = [[0, 1, 1], [1, 0, 0]]
+        saved_fn = Generator._file_prefix + '_pickled_test'
+        with open(saved_fn, 'wb') as file:
+            pickle.dump({"wsr": wsr, "shots": 10, "job_id": "1234", "job_type": "job"}, file)
+        try:
+            r_job = Generator.recover(saved_fn, mock.MagicMock())
+        finally:
+            os.remove(saved_fn)
+        self.assertEqual(r_job.wsr, wsr)
+        self.assertEqual(r_job.shots, 10)
+
     def test_num_circs_shots(self):
         """Test the number of circuits and shots generated."""
         backend = FakeValencia()
@@ -82,3 +99,35 @@ class TestGenerator(TestCase):
             with self.subTest(num_raw_bits=num_raw_bits):
                 result = generator.sample(num_raw_bits=num_raw_bits).block_until_ready()
                 self.assertGreaterEqual(len(result.raw_bits), num_raw_bits)
+
+    def test_backend_change(self):
+        """Test cached backend information is refreshed when the backend changes."""
+        generator = Generator(FakeValencia())
+        generator.sample(num_raw_bits=100)
+        backend = FakeVigo()
+        backend._configuration.max_shots = 10
+        generator.backend = backend
+        with mock.patch('qiskit_rng.generator.transpile', wraps=transpile) as mock_transpile:
+            job = generator.sample(num_raw_bits=100)
+        self.assertEqual(mock_transpile.call_count, 1)
+        self.assertEqual(mock_transpile.call_args[1]['backend'], backend)
+        self.assertLessEqual(job.shots, 10)
+
+    def test_preserve_barriers(self):
+        """Test leaving out the barrier from the circuits."""
+        for preserve_barriers in [True, False]:
+            with self.subTest(preserve_barriers=preserve_barriers):
+                generator = Generator(FakeValencia(), preserve_barriers=preserve_barriers)
+                wsr_bits = np.array(list(product([0, 1], repeat=3)), dtype=np.uint8)
+                circuits = generator._generate_all_circuits(len(wsr_bits), wsr_bits)
+                self.assertEqual(len(circuits), 8)
+                for circ in circuits:
+                    self.assertEqual('barrier' in circ.count_ops(), preserve_barriers)
+
+    def test_transpile_once(self):
+        """Test the circuits are only transpiled once for multiple samplings."""
+        generator = Generator(FakeValencia())
+        with mock.patch('qiskit_rng.generator.transpile', wraps=transpile) as mock_transpile:
+            generator.sample(num_raw_bits=100)
+            generator.sample(num_raw_bits=300)
+        self.assertEqual(mock_transpile.call_count, 1)
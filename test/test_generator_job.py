@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test for the generator job."""
+
+from unittest import TestCase, mock
+
+import numpy as np
+from qiskit.result import Result
+from qiskit_rng import GeneratorJob
+
+
+class TestGeneratorJob(TestCase):
+    """Test generator job."""
+
+    def test_result_transform(self):
+        """Test transforming hexadecimal memory into bits."""
+        memory = [['0x1', '0x6', '0x3'], ['0x0', '0x7']]
+        result = _make_result(memory, 3)
+        job = _make_job()
+        self.assertEqual(job._ibmq_result_transform(result).tolist(),
+                         _reversed_bitstrings(result))
+        self.assertEqual(job._ibmq_result_transform(result).tolist(),
+                         [[1, 0, 0], [0, 1, 1], [1, 1, 0], [0, 0, 0], [1, 1, 1]])
+
+    def test_result_transform_hex_digits(self):
+        """Test transforming memory with hexadecimal digits above 9."""
+        memory = [['0xa', '0xf', '0x5'], ['0x10', '0x1f']]
+        for circ_memory, num_slots in [(memory[0], 4), (memory[1], 5)]:
+            with self.subTest(memory=circ_memory):
+                result = _make_result([circ_memory], num_slots)
+                self.assertEqual(_make_job()._ibmq_result_transform(result).tolist(),
+                                 _reversed_bitstrings(result))
+
+    def test_result_transform_no_memory_data(self):
+        """Test transforming results whose data has no memory attribute."""
+        memory = [['0x1', '0x6'], ['0x3']]
+        result = _make_result(memory, 3)
+        expected = _reversed_bitstrings(result)
+        bitstrings = [result.get_memory(i) for i in range(len(memory))]
+        for exp_result in result.results:
+            del exp_result.data.memory
+        with mock.patch.object(result, 'get_memory', side_effect=bitstrings):
+            self.assertEqual(_make_job()._ibmq_result_transform(result).tolist(), expected)
+
+
+def _make_result(memory, num_slots):
+    """Return a ``Result`` with the given level 2 memory for each experiment."""
+    return Result.from_dict({
+        'backend_name': 'test_backend',
+        'backend_version': '1.0.0',
+        'qobj_id': 'test_qobj',
+        'job_id': 'test_job',
+        'success': True,
+        'results': [{
+            'shots': len(circ_memory),
+            'success': True,
+            'meas_level': 2,
+            'data': {'memory': circ_memory},
+            'header': {'memory_slots': num_slots, 'creg_sizes': [['c', num_slots]]}
+        } for circ_memory in memory]
+    })
+
+
+def _make_job():
+    """Return a ``GeneratorJob`` for transforming results."""
+    return GeneratorJob(initial_wsr=[], wsr=np.zeros((1, 3), dtype=np.uint8),
+                        job=mock.MagicMock(), shots=1)
+
+
+def _reversed_bitstrings(result):
+    """Return the shots of each experiment as reversed bit strings, one bit per item."""
+    return [[int(bit) for bit in reversed(shot)]
+            for i in range(len(result.results)) for shot in result.get_memory(i)]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test for the utility functions."""
+
+from unittest import TestCase, skipUnless
+
+from qiskit_rng.utils import (bell_value, bitarray_to_bytes, bytes_to_bitarray, prime_check,
+                              prime_factors, na_set, get_extractor_bits, raw_bits_to_bytes,
+                              generate_wsr, generate_wsr_bytes)
+from qiskit_rng._numeric import HAS_NUMBA
+
+
+class TestUtils(TestCase):
+    """Test utility functions."""
+
+    def test_bell_value(self):
+        """Test calculating bell values."""
+        # Rounds with a WSR sum of 1 are lost on odd parity, and rounds
+        # with a WSR sum of 3 are lost on even parity.
+        wsr = [[1, 0, 0], [1, 1, 1], [0, 0, 0], [1, 1, 0]]
+        raw_bits = [[1, 0, 0], [1, 1, 0], [1, 0, 1], [0, 0, 1]]
+        self.assertEqual(bell_value(wsr, raw_bits), (0.5, 0.5, -4))
+
+    def test_bell_value_shots(self):
+        """Test calculating bell values with multiple shots per WSR."""
+        wsr = [[1, 0, 0], [1, 1, 1]]
+        raw_bits = [[1, 0, 0], [0, 0, 0], [1, 1, 0], [1, 1, 1]]
+        self.assertEqual(bell_value(wsr, raw_bits, shots=2), (0.5, 0.5, -4))
+
+    def test_bitarray_to_bytes(self):
+        """Test converting bits to bytes."""
+        self.assertEqual(bitarray_to_bytes([1, 0, 0, 0, 0, 0, 0, 0, 1, 1]), b'\x01\x03')
+        self.assertEqual(bitarray_to_bytes([]), b'')
+
+    def test_bytes_to_bitarray(self):
+        """Test converting bytes to bits."""
+        bits = [1, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1]
+        self.assertEqual(bytes_to_bitarray(bitarray_to_bytes(bits), len(bits)).tolist(), bits)
+
+    def test_prime_check(self):
+        """Test checking for prime numbers."""
+        primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+        for num in range(50):
+            with self.subTest(num=num):
+                self.assertEqual(prime_check(num), num in primes)
+        self.assertFalse(prime_check(7919 * 7927))
+        self.assertTrue(prime_check(2147483647))
+
+    @skipUnless(HAS_NUMBA, "Trial division close to 2**63 is too slow without Numba.")
+    def test_prime_check_int64_limit(self):
+        """Test checking for prime numbers close to the 64-bit integer limit."""
+        self.assertTrue(prime_check(2**63 - 25))
+
+    def test_prime_factors(self):
+        """Test factorizing numbers."""
+        self.assertEqual(prime_factors(12, False), [2, 2, 3])
+        self.assertEqual(prime_factors(12, True), [[2, 3], [2, 1]])
+        self.assertEqual(prime_factors(2**5 * 7**2 * 1009, True), [[2, 7, 1009], [5, 2, 1]])
+        self.assertEqual(prime_factors(1000003 * 999983, True), [[999983, 1000003], [1, 1]])
+        # Too large for the compiled kernel.
+        self.assertEqual(prime_factors(2**64 * 3**5, True), [[2, 3], [64, 5]])
+
+    def test_na_set(self):
+        """Test finding numbers in the extractor input set."""
+        # The last input is too large for the compiled primality test.
+        for num_bits, expected in [(2, 2), (100, 100), (1000, 946), (123456, 123426),
+                                   (2**31 + 1000, 2147484612)]:
+            with self.subTest(num_bits=num_bits):
+                self.assertEqual(na_set(num_bits), expected)
+
+    def test_get_extractor_bits(self):
+        """Test getting the extractor bits from raw bits."""
+        self.assertEqual(get_extractor_bits([[1, 0, 1], [0, 1, 1]]), [1, 0, 0, 1])
+        self.assertEqual(get_extractor_bits([]), [])
+
+    def test_raw_bits_to_bytes(self):
+        """Test converting raw bits to extractor input bytes."""
+        raw_bits = [[1, 0, 1], [1, 1, 0], [0, 1, 1], [1, 1, 1], [0, 0, 1]]
+        bits = get_extractor_bits(raw_bits)
+        self.assertEqual(bits, [1, 0, 1, 1, 0, 1, 1, 1, 0, 0])
+        self.assertEqual(raw_bits_to_bytes(raw_bits), bitarray_to_bytes(bits))
+        self.assertEqual(raw_bits_to_bytes(raw_bits, 7), bitarray_to_bytes(bits[:7]))
+        self.assertEqual(raw_bits_to_bytes([]), b'')
+
+    def test_generate_wsr(self):
+        """Test generating WSR bits."""
+        for secure in [True, False]:
+            with self.subTest(secure=secure):
+                wsr = generate_wsr(11, secure=secure)
+                self.assertEqual(len(wsr), 11)
+                self.assertTrue(set(wsr.tolist()) <= {0, 1})
+                # Unused bits in the last byte are cleared.
+                self.assertLess(generate_wsr_bytes(11, secure=secure)[-1], 8)
+
+    def test_generate_wsr_default(self):
+        """Test the default WSR generator is deprecated."""
+        with self.assertWarns(DeprecationWarning):
+            wsr = generate_wsr(5)
+        self.assertEqual(len(wsr), 5)